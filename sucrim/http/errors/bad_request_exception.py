@@ -1,6 +1,6 @@
 """Bad Request (400) exception for microservices."""
 
-from typing import Any, List, Optional
+from typing import Any, Optional, Sequence
 
 from .business_exception import BusinessException
 
@@ -17,11 +17,13 @@ class BadRequestException(BusinessException):
         errors: Optional list of detailed error information
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
         process: str = "Processing Client Request",
-        errors: Optional[List[Any]] = None,
+        errors: Optional[Sequence[Any]] = None,
     ):
         """
         Initialize bad request exception.
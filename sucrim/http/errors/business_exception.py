@@ -1,6 +1,10 @@
 """Business logic exception - main exception class for microservices."""
 
-from typing import Any, List, Optional
+from typing import Any, Optional, Sequence, Type
+
+# Shared value for exceptions raised without error details (None or empty), so
+# raising one does not allocate a new empty list
+_EMPTY_ERRORS: Sequence[Any] = ()
 
 
 class BusinessException(Exception):
@@ -21,12 +25,14 @@ class BusinessException(Exception):
         errors: Optional list of detailed error information
     """
 
+    __slots__ = ("message", "process", "status_code", "errors", "_dict_cache", "_str")
+
     def __init__(
         self,
         message: str,
         process: str,
         status_code: int = 400,
-        errors: Optional[List[Any]] = None,
+        errors: Optional[Sequence[Any]] = None,
     ):
         """
         Initialize business exception.
@@ -41,22 +47,65 @@ class BusinessException(Exception):
         self.message = message
         self.process = process
         self.status_code = status_code
-        self.errors = errors or []
+        self.errors = errors if errors else _EMPTY_ERRORS
+        self._dict_cache: Optional[dict] = None
+        # Built once here: __str__ runs for every log line and traceback
+        self._str = f"{process}: {message}"
+
+    def __reduce__(self):
+        """
+        Support pickling (e.g. multiprocessing, task queues).
+
+        BaseException only pickles args and __dict__, which would drop the
+        slot attributes, so they are passed explicitly as state. The instance
+        is recreated without calling __init__, because subclasses differ in
+        which arguments it requires.
+        """
+        return (
+            _new_exception,
+            (type(self), self.args),
+            {
+                "message": self.message,
+                "process": self.process,
+                "status_code": self.status_code,
+                "errors": self.errors,
+                "_dict_cache": None,
+                "_str": self._str,
+            },
+        )
 
     def __str__(self) -> str:
         """String representation of the exception."""
-        return f"{self.process}: {self.message}"
+        return self._str
 
     def to_dict(self) -> dict:
         """
         Convert exception to dictionary for JSON responses.
 
+        The dictionary is built on the first call and reused afterwards, so it
+        should be treated as read-only.
+
         Returns:
             dict: Exception data as dictionary
         """
-        return {
-            "message": self.message,
-            "process": self.process,
-            "errors": self.errors,
-        }
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "message": self.message,
+                "process": self.process,
+                "errors": self.errors,
+            }
+        return self._dict_cache
 
+
+def _new_exception(cls: Type[BusinessException], args: tuple) -> BusinessException:
+    """
+    Create an exception instance for unpickling without running __init__.
+
+    Args:
+        cls: Exception class to instantiate
+        args: Exception args
+
+    Returns:
+        Uninitialized exception whose state is restored by pickle
+    """
+    return cls.__new__(cls, *args)
@@ -1,6 +1,6 @@
 """Conflict (409) exception for microservices."""
 
-from typing import Any, List, Optional
+from typing import Any, Optional, Sequence
 
 from .business_exception import BusinessException
 
@@ -18,11 +18,13 @@ class ConflictException(BusinessException):
         errors: Optional list of detailed error information
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
         process: str = "Resource Conflict",
-        errors: Optional[List[Any]] = None,
+        errors: Optional[Sequence[Any]] = None,
     ):
         """
         Initialize conflict exception.
@@ -1,6 +1,6 @@
 """Not Found (404) exception for microservices."""
 
-from typing import Any, List, Optional
+from typing import Any, Optional, Sequence
 
 from .business_exception import BusinessException
 
@@ -17,11 +17,13 @@ class NotFoundException(BusinessException):
         errors: Optional list of detailed error information
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
         process: str = "Resource Lookup",
-        errors: Optional[List[Any]] = None,
+        errors: Optional[Sequence[Any]] = None,
     ):
         """
         Initialize not found exception.
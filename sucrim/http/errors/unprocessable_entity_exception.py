@@ -1,6 +1,6 @@
 """Unprocessable Entity (422) exception for microservices."""
 
-from typing import Any, List, Optional
+from typing import Any, Optional, Sequence
 
 from .business_exception import BusinessException
 
@@ -18,11 +18,13 @@ class UnprocessableEntityException(BusinessException):
         errors: Optional list of detailed validation errors
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
         process: str = "Data Validation",
-        errors: Optional[List[Any]] = None,
+        errors: Optional[Sequence[Any]] = None,
     ):
         """
         Initialize unprocessable entity exception.
@@ -1,6 +1,6 @@
 """Validation exceptions for microservices."""
 
-from typing import Any, List, Optional
+from typing import Any, Optional, Sequence
 
 from .business_exception import BusinessException
 
@@ -19,12 +19,14 @@ class ValidationException(BusinessException):
         errors: Optional list of detailed validation errors
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         message: str,
         process: str,
         status_code: int = 422,
-        errors: Optional[List[Any]] = None,
+        errors: Optional[Sequence[Any]] = None,
     ):
         """
         Initialize validation exception.
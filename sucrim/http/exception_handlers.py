@@ -1,11 +1,58 @@
 """Exception handlers for FastAPI applications."""
 
+import orjson
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 from jose import ExpiredSignatureError
 
 from sucrim.http.errors import BusinessException
 
+_JSON_MEDIA_TYPE = "application/json"
+
+# Detail fragment fastapi-keycloak uses when the user lacks a required role
+_MISSING_ROLE_DETAIL = "is required to perform this action"
+
+# Static error bodies are serialized once instead of on every error response
+_EXPIRED_TOKEN_BODY = orjson.dumps(
+    {
+        "message": "Token has expired.",
+        "process": "access_token",
+        "errors": None,
+    }
+)
+_NOT_AUTHORIZED_BODY = orjson.dumps(
+    {
+        "message": "You are not authorized to perform this action",
+        "process": "general_error",
+        "errors": None,
+    }
+)
+_UNEXPECTED_ERROR_BODY = orjson.dumps(
+    {
+        "message": "An unexpected error occurred",
+        "process": "internal_error",
+        "errors": None,
+    }
+)
+
+
+def _json_response(status_code: int, content: dict) -> Response:
+    """
+    Build a JSON response serialized with orjson.
+
+    Args:
+        status_code: HTTP status code
+        content: JSON-serializable response body
+
+    Returns:
+        Response with an application/json body
+    """
+    return Response(
+        content=orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS),
+        status_code=status_code,
+        media_type=_JSON_MEDIA_TYPE,
+    )
+
 
 def setup_exception_handlers(app: FastAPI) -> None:
     """
@@ -23,9 +70,9 @@ def setup_exception_handlers(app: FastAPI) -> None:
     @app.exception_handler(BusinessException)
     async def business_exception_handler(request: Request, exc: BusinessException):
         """Handle custom business exceptions."""
-        return JSONResponse(
-            status_code=exc.status_code,
-            content={
+        return _json_response(
+            exc.status_code,
+            {
                 "message": exc.message,
                 "process": exc.process,
                 "errors": exc.errors,
@@ -35,33 +82,32 @@ def setup_exception_handlers(app: FastAPI) -> None:
     @app.exception_handler(ExpiredSignatureError)
     async def expired_token_handler(request: Request, exc: ExpiredSignatureError):
         """Handle expired JWT tokens."""
-        return JSONResponse(
+        return Response(
+            content=_EXPIRED_TOKEN_BODY,
             status_code=401,
-            content={
-                "message": "Token has expired.",
-                "process": "access_token",
-                "errors": None,
-            },
+            media_type=_JSON_MEDIA_TYPE,
         )
 
     @app.exception_handler(HTTPException)
     async def http_exception_handler(request: Request, exc: HTTPException):
         """Handle FastAPI HTTP exceptions."""
         # Check for specific unauthorized messages
-        if exc.status_code == 403 and "is required to perform this action" in str(exc.detail):
-            return JSONResponse(
+        detail = exc.detail
+        if (
+            exc.status_code == 403
+            and type(detail) is str
+            and _MISSING_ROLE_DETAIL in detail
+        ):
+            return Response(
+                content=_NOT_AUTHORIZED_BODY,
                 status_code=exc.status_code,
-                content={
-                    "message": "You are not authorized to perform this action",
-                    "process": "general_error",
-                    "errors": None,
-                },
+                media_type=_JSON_MEDIA_TYPE,
             )
         
-        return JSONResponse(
-            status_code=exc.status_code,
-            content={
-                "message": str(exc.detail),
+        return _json_response(
+            exc.status_code,
+            {
+                "message": str(detail),
                 "process": "general_error",
                 "errors": None,
             },
@@ -70,12 +116,9 @@ def setup_exception_handlers(app: FastAPI) -> None:
     @app.exception_handler(Exception)
     async def generic_exception_handler(request: Request, exc: Exception):
         """Handle unexpected exceptions."""
-        return JSONResponse(
+        return Response(
+            content=_UNEXPECTED_ERROR_BODY,
             status_code=500,
-            content={
-                "message": "An unexpected error occurred",
-                "process": "internal_error",
-                "errors": None,
-            },
+            media_type=_JSON_MEDIA_TYPE,
         )
 
@@ -10,11 +10,22 @@ T = TypeVar("T")
 
 
 class ApiResponseDto(BaseModel, Generic[T]):
-    """Generic API response DTO with optional pagination."""
+    """
+    Generic API response DTO with optional pagination.
+
+    The ok* factory methods are meant for trusted data produced by the service
+    layer, so they skip validation; build the model directly to validate input.
+    """
 
     data: Optional[T] = None
     pagination: Optional[Pagination] = None
 
+    class Config:
+        """Pydantic configuration."""
+
+        defer_build = True  # Build the validator on first use, not at import
+        arbitrary_types_allowed = True
+
     @classmethod
     def ok(cls, data: Optional[T] = None) -> "ApiResponseDto[T]":
         """
@@ -26,7 +37,7 @@ class ApiResponseDto(BaseModel, Generic[T]):
         Returns:
             ApiResponseDto instance with the provided data
         """
-        return cls(data=data)
+        return cls.model_construct(data=data)
 
     @classmethod
     def ok_with_pagination(
@@ -39,12 +50,12 @@ class ApiResponseDto(BaseModel, Generic[T]):
 
         Args:
             data: List of items for the current page
-            pagination: Pagination object (total_elements will be set if not already)
+            pagination: Pagination object
 
         Returns:
             ApiResponseDto instance with data and pagination
         """
-        return cls(data=data, pagination=pagination)
+        return cls.model_construct(data=data, pagination=pagination)
 
     @classmethod
     def ok_from_page(
@@ -56,18 +67,30 @@ class ApiResponseDto(BaseModel, Generic[T]):
         """
         Create a successful paginated response from a page result.
 
-        This method sets total_elements on the pagination object if provided.
+        If total_elements is provided, the response gets a copy of the
+        pagination object with total_elements and total_pages set; the
+        pagination object passed in is not modified, so it can be shared
+        between responses.
 
         Args:
             page_result: List of items from the page
             pagination: Pagination object
-            total_elements: Total number of elements (will be set on pagination)
+            total_elements: Total number of elements (set on the response pagination)
 
         Returns:
             ApiResponseDto instance with data and pagination
         """
         if total_elements is not None:
-            pagination.set_total_elements(total_elements)
-
-        return cls(data=page_result, pagination=pagination)
+            page_size = pagination.page_size
+            # model_copy skips validation, so compute total_pages here
+            pagination = pagination.model_copy(
+                update={
+                    "total_elements": total_elements,
+                    "total_pages": (
+                        -(-total_elements // page_size) if page_size > 0 else None
+                    ),
+                }
+            )
+
+        return cls.model_construct(data=page_result, pagination=pagination)
 
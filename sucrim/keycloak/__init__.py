@@ -1,6 +1,6 @@
 """Keycloak authentication and authorization modules."""
 
-from .keycloak_auth_provider import KeycloakAuthProvider
+from .keycloak_auth_provider import KeycloakAuthProvider, get_auth_provider
 from .keycloak_config import KeycloakConfig, get_idp, get_keycloak_config
 from .keycloak_jwt_decoder import KeycloakJwtDecoder
 from .keycloak_user import KeycloakUser
@@ -10,6 +10,7 @@ __all__ = [
     "KeycloakAuthProvider",
     "KeycloakJwtDecoder",
     "KeycloakUser",
+    "get_auth_provider",
     "get_idp",
     "get_keycloak_config",
 ]
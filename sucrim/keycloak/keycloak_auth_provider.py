@@ -1,9 +1,12 @@
 """Keycloak authentication provider with automatic reconnection."""
 
+import threading
 import time
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional
 
 import httpx
+import orjson
 from loguru import logger
 
 from sucrim.keycloak.keycloak_config import KeycloakConfig, get_keycloak_config
@@ -21,6 +24,11 @@ class KeycloakAuthProvider:
     CONNECTION_TIMEOUT_SECONDS = 10
     BEARER_PREFIX = "Bearer "
 
+    # Client settings are immutable, so they are built once and shared by reconnects
+    _TIMEOUT = httpx.Timeout(CONNECTION_TIMEOUT_SECONDS, connect=CONNECTION_TIMEOUT_SECONDS)
+    _LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+    _SYNC_LIMITS = httpx.Limits(max_keepalive_connections=2)
+
     def __init__(self, config: Optional[KeycloakConfig] = None):
         """
         Initialize Keycloak authentication provider.
@@ -30,22 +38,28 @@ class KeycloakAuthProvider:
         """
         self.config = config or get_keycloak_config()
         self._access_token: Optional[str] = None
+        # Derived from the access token once per refresh instead of per call
+        self._bearer_token: Optional[str] = None
+        self._auth_headers: Mapping[str, str] = MappingProxyType({})
         self._token_expires_at: float = 0.0
         self._last_init_time: float = 0.0
         self._client: Optional[httpx.AsyncClient] = None
+        self._sync_client: Optional[httpx.Client] = None
         self._initialize()
 
     def _initialize(self) -> None:
         """Initialize the Keycloak client and get initial token."""
         try:
-            self._client = httpx.AsyncClient(
-                timeout=httpx.Timeout(
-                    self.CONNECTION_TIMEOUT_SECONDS,
-                    connect=self.CONNECTION_TIMEOUT_SECONDS,
-                ),
-                limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
-            )
-            self._last_init_time = time.time()
+            # The clients are created once and kept across reconnects: replacing
+            # them would close connections under requests still in flight, and
+            # the httpx pools already recycle idle connections
+            if self._client is None:
+                self._client = httpx.AsyncClient(timeout=self._TIMEOUT, limits=self._LIMITS)
+            # Token refreshes are synchronous; keep one pooled client for them so
+            # each refresh reuses the keep-alive connection instead of a new handshake
+            if self._sync_client is None:
+                self._sync_client = httpx.Client(timeout=self._TIMEOUT, limits=self._SYNC_LIMITS)
+            self._last_init_time = time.monotonic()
             self._refresh_token()
             logger.info(
                 f"Keycloak client initialized successfully for realm: {self.config.realm}"
@@ -80,19 +94,20 @@ class KeycloakAuthProvider:
         }
 
         try:
-            # Use sync client for token refresh
-            with httpx.Client(timeout=self.CONNECTION_TIMEOUT_SECONDS) as client:
-                response = client.post(token_url, data=data)
-                response.raise_for_status()
-                token_data = response.json()
+            response = self._sync_client.post(token_url, data=data)
+            response.raise_for_status()
+            token_data = orjson.loads(response.content)
 
             self._access_token = token_data.get("access_token")
             expires_in = token_data.get("expires_in", 300)  # Default 5 minutes
-            self._token_expires_at = time.time() + expires_in - 60  # Refresh 1 min early
+            self._token_expires_at = time.monotonic() + expires_in - 60  # Refresh 1 min early
 
             if not self._access_token:
                 raise ValueError("Access token not found in response")
 
+            self._bearer_token = self.BEARER_PREFIX + self._access_token
+            self._auth_headers = MappingProxyType({"Authorization": self._bearer_token})
+
             logger.debug("Keycloak admin access token refreshed successfully")
             return self._access_token
 
@@ -107,14 +122,23 @@ class KeycloakAuthProvider:
                 "Keycloak client has not been initialized. Call _initialize() first."
             )
 
-    def _reconnect_if_needed(self) -> None:
-        """Reconnect if the reconnect interval has passed."""
-        current_time = time.time()
-        if current_time - self._last_init_time > self.RECONNECT_INTERVAL_SECONDS:
+    def _reconnect_if_needed(self, now: float) -> bool:
+        """
+        Reconnect if the reconnect interval has passed.
+
+        Args:
+            now: Current time.monotonic() value
+
+        Returns:
+            True if the client was reconnected (which also refreshes the token)
+        """
+        if now - self._last_init_time > self.RECONNECT_INTERVAL_SECONDS:
             logger.info(
                 f"Reconnecting Keycloak client after {self.RECONNECT_INTERVAL_SECONDS / 60} minutes"
             )
             self._initialize()
+            return True
+        return False
 
     def get_admin_access_token(self) -> str:
         """
@@ -124,13 +148,13 @@ class KeycloakAuthProvider:
             Access token string
         """
         self._ensure_initialized()
-        self._reconnect_if_needed()
 
-        # Refresh token if expired or about to expire
-        if time.time() >= self._token_expires_at:
-            self._refresh_token()
-
-        if not self._access_token:
+        now = time.monotonic()
+        # Reconnecting already fetches a fresh token; otherwise refresh it if
+        # it is missing, expired or about to expire
+        if not self._reconnect_if_needed(now) and (
+            now >= self._token_expires_at or not self._access_token
+        ):
             self._refresh_token()
 
         return self._access_token
@@ -142,8 +166,18 @@ class KeycloakAuthProvider:
         Returns:
             Access token string with "Bearer " prefix
         """
-        token = self.get_admin_access_token()
-        return f"{self.BEARER_PREFIX}{token}"
+        self.get_admin_access_token()
+        return self._bearer_token
+
+    def get_admin_auth_headers(self) -> Mapping[str, str]:
+        """
+        Get a read-only Authorization header mapping for the admin access token.
+
+        Returns:
+            Mapping with the "Authorization" header set to the Bearer token
+        """
+        self.get_admin_access_token()
+        return self._auth_headers
 
     async def get_client(self) -> httpx.AsyncClient:
         """
@@ -153,12 +187,40 @@ class KeycloakAuthProvider:
             httpx.AsyncClient instance
         """
         self._ensure_initialized()
-        self._reconnect_if_needed()
+        self._reconnect_if_needed(time.monotonic())
         return self._client
 
     async def close(self) -> None:
-        """Close the HTTP client."""
+        """Close the HTTP clients."""
         if self._client:
             await self._client.aclose()
             self._client = None
+        if self._sync_client:
+            self._sync_client.close()
+            self._sync_client = None
+
+
+# Global instance (singleton pattern)
+_auth_provider: Optional[KeycloakAuthProvider] = None
+# Construction fetches a token over the network, so concurrent first calls
+# (e.g. sync dependencies in FastAPI's threadpool) must not each build one
+_auth_provider_lock = threading.Lock()
 
+
+def get_auth_provider() -> KeycloakAuthProvider:
+    """
+    Get KeycloakAuthProvider instance (singleton).
+
+    The provider is created on first use with the configuration from
+    get_keycloak_config(), so its HTTP clients and admin token are shared
+    instead of being rebuilt per request or router.
+
+    Returns:
+        KeycloakAuthProvider: Shared authentication provider
+    """
+    global _auth_provider
+    if _auth_provider is None:
+        with _auth_provider_lock:
+            if _auth_provider is None:
+                _auth_provider = KeycloakAuthProvider()
+    return _auth_provider
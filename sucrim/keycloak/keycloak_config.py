@@ -1,15 +1,58 @@
 """Keycloak configuration for Phoenix microservices."""
 
+from __future__ import annotations
+
+from collections import namedtuple
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
 from os import environ
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Dict, Optional
+
+if TYPE_CHECKING:
+    from fastapi_keycloak import FastAPIKeycloak
+
+
+_KeycloakEnv = namedtuple(
+    "_KeycloakEnv",
+    [
+        "server_url",
+        "client_id",
+        "client_secret",
+        "admin_client_id",
+        "admin_client_secret",
+        "realm",
+        "callback_uri",
+    ],
+)
 
-from fastapi_keycloak import FastAPIKeycloak
-from pydantic import BaseModel, Field
 
+@lru_cache(maxsize=1)
+def _load_env() -> _KeycloakEnv:
+    """
+    Read the Keycloak environment variables once and cache the snapshot.
+
+    Environment variables do not change after process start, so every
+    KeycloakConfig shares the same snapshot instead of querying os.environ
+    for each field on each instantiation.
 
-class KeycloakConfig(BaseModel):
+    Returns:
+        _KeycloakEnv: Immutable snapshot of the KC_* environment variables
     """
-    Keycloak configuration model.
+    return _KeycloakEnv(
+        server_url=environ.get("KC_SERVER_URL"),
+        client_id=environ.get("KC_CLIENT_ID"),
+        client_secret=environ.get("KC_CLIENT_SECRET"),
+        admin_client_id=environ.get("KC_ADMIN_CLIENT_ID"),
+        admin_client_secret=environ.get("KC_ADMIN_CLIENT_SECRET"),
+        realm=environ.get("KC_REALM"),
+        callback_uri=environ.get("KC_CALLBACK_URI"),
+    )
+
+
+@dataclass(slots=True, frozen=True)
+class KeycloakConfig:
+    """
+    Keycloak configuration.
     
     Reads configuration from environment variables:
     - KC_SERVER_URL: Keycloak server URL
@@ -19,15 +62,29 @@ class KeycloakConfig(BaseModel):
     - KC_ADMIN_CLIENT_SECRET: Admin client secret
     - KC_REALM: Keycloak realm name
     - KC_CALLBACK_URI: OAuth callback URI
+
+    The variables are read once per process (see _load_env) and shared by
+    every instance.
     """
 
-    server_url: Optional[str] = Field(default_factory=lambda: environ.get("KC_SERVER_URL", None))
-    client_id: Optional[str] = Field(default_factory=lambda: environ.get("KC_CLIENT_ID", None))
-    client_secret: Optional[str] = Field(default_factory=lambda: environ.get("KC_CLIENT_SECRET", None))
-    admin_client_id: Optional[str] = Field(default_factory=lambda: environ.get("KC_ADMIN_CLIENT_ID", None))
-    admin_client_secret: Optional[str] = Field(default_factory=lambda: environ.get("KC_ADMIN_CLIENT_SECRET", None))
-    realm: Optional[str] = Field(default_factory=lambda: environ.get("KC_REALM", None))
-    callback_uri: Optional[str] = Field(default_factory=lambda: environ.get("KC_CALLBACK_URI", None))
+    server_url: Optional[str] = field(default_factory=lambda: _load_env().server_url)
+    client_id: Optional[str] = field(default_factory=lambda: _load_env().client_id)
+    client_secret: Optional[str] = field(default_factory=lambda: _load_env().client_secret)
+    admin_client_id: Optional[str] = field(default_factory=lambda: _load_env().admin_client_id)
+    admin_client_secret: Optional[str] = field(default_factory=lambda: _load_env().admin_client_secret)
+    realm: Optional[str] = field(default_factory=lambda: _load_env().realm)
+    callback_uri: Optional[str] = field(default_factory=lambda: _load_env().callback_uri)
+
+    def model_dump(self) -> Dict[str, Any]:
+        """
+        Convert the configuration to a dictionary.
+
+        Kept for callers written against the former pydantic model.
+
+        Returns:
+            Dictionary with every field of the configuration
+        """
+        return asdict(self)
 
 
 # Global instance (singleton pattern)
@@ -59,7 +116,11 @@ def get_idp() -> FastAPIKeycloak:
     """
     global _idp_instance
     if _idp_instance is None:
+        # Imported lazily: fastapi_keycloak pulls in python-jose, cryptography
+        # and requests, which only services that actually use the IdP need.
+        from fastapi_keycloak import FastAPIKeycloak
+
         config = get_keycloak_config()
-        _idp_instance = FastAPIKeycloak(**config.model_dump())
+        _idp_instance = FastAPIKeycloak(**asdict(config))
     return _idp_instance
 
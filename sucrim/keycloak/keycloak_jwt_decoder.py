@@ -1,14 +1,53 @@
 """Keycloak JWT token decoder for extracting user information."""
 
-from typing import List, Optional
-
-from jose import jwt
-from jose.exceptions import JWTError
+import base64
+import binascii
+import hashlib
+import threading
+import time
+from contextvars import ContextVar
+from itertools import chain
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+import orjson
+from cachetools import TTLCache
 from loguru import logger
 
 from sucrim.http.errors import UnauthorizedException
 from sucrim.keycloak.keycloak_user import KeycloakUser
 
+# Claim names read into KeycloakUser. orjson already reuses cached key strings with
+# precomputed hashes, so looking these up needs no extra interning of the claims dict.
+CLAIM_USERNAME = "preferred_username"
+CLAIM_USER_ID = "sid"
+CLAIM_TENANT_ID = "tenantId"
+CLAIM_EMAIL = "email"
+CLAIM_FIRST_NAME = "given_name"
+CLAIM_LAST_NAME = "family_name"
+CLAIM_CLIENT_ID = "azp"
+CLAIM_EMAIL_VERIFIED = "email_verified"
+
+# String values accepted as true for boolean claims (compared lowercased)
+_TRUTHY_CLAIM_VALUES = frozenset({"true", "1", "yes"})
+
+# Path segment that precedes the realm name in a Keycloak issuer URL
+REALMS_PATH_SEPARATOR = "/realms/"
+
+# Decoded users keyed by a 16-byte digest of the token (rather than the multi-KB token
+# itself), so a token presented repeatedly is decoded once.
+# Entries live for at most TOKEN_CACHE_TTL_SECONDS and never past the token's exp.
+TOKEN_CACHE_TTL_SECONDS = 60
+TOKEN_CACHE_MAX_SIZE = 1024
+_token_cache: TTLCache = TTLCache(maxsize=TOKEN_CACHE_MAX_SIZE, ttl=TOKEN_CACHE_TTL_SECONDS)
+_token_cache_lock = threading.RLock()
+
+# Last (token, user, expires_at) decoded in the current context. ASGI servers run each
+# request in its own context, so dependencies decoding the same token object within a
+# request get the user back without hashing the token again.
+_current_user: ContextVar[Optional[Tuple[str, KeycloakUser, Optional[float]]]] = ContextVar(
+    "keycloak_current_user", default=None
+)
+
 
 class KeycloakJwtDecoder:
     """
@@ -19,6 +58,7 @@ class KeycloakJwtDecoder:
     """
 
     BEARER_PREFIX = "Bearer "
+    BEARER_PREFIX_LENGTH = len(BEARER_PREFIX)
     JWT_PARTS_COUNT = 3
 
     @staticmethod
@@ -30,6 +70,12 @@ class KeycloakJwtDecoder:
         For production use, you should verify the signature using Keycloak's
         public key for security.
 
+        Decoded users are cached per token for up to TOKEN_CACHE_TTL_SECONDS
+        (capped by the token's exp claim), so repeated calls with the same
+        token return the same KeycloakUser instance. Within one request
+        context the same token object is recognized by identity, skipping
+        the cache lookup as well.
+
         Args:
             token: JWT token string (with or without "Bearer " prefix)
 
@@ -39,6 +85,12 @@ class KeycloakJwtDecoder:
         Raises:
             UnauthorizedException: If token is invalid or cannot be decoded
         """
+        current = _current_user.get()
+        if current is not None and current[0] is token:
+            _, user, expires_at = current
+            if expires_at is None or time.time() < expires_at:
+                return user
+
         if not token or not token.strip():
             logger.error("Token is null or empty")
             raise UnauthorizedException(
@@ -46,47 +98,49 @@ class KeycloakJwtDecoder:
                 process="token_decode"
             )
 
-        if not KeycloakJwtDecoder._is_valid_jwt_format(token):
-            logger.error("Invalid JWT format")
-            raise UnauthorizedException(
-                message="Invalid JWT format",
-                process="token_decode"
-            )
+        normalized_token, payload_b64 = KeycloakJwtDecoder._parse_token(token)
+        cache_key = KeycloakJwtDecoder._cache_key(normalized_token)
+        with _token_cache_lock:
+            cached = _token_cache.get(cache_key)
+        if cached is not None:
+            user, expires_at = cached
+            if expires_at is None or time.time() < expires_at:
+                _current_user.set((token, user, expires_at))
+                return user
 
         try:
-            normalized_token = KeycloakJwtDecoder._normalize_token(token)
-            
             # Decode without verification (for extracting claims only)
             # Note: For production, you should verify the signature using Keycloak's public key
-            # Using an empty string as key and options={"verify_signature": False} to decode without verification
-            claims = jwt.decode(
-                normalized_token,
-                key="",  # Empty key since we're not verifying
-                options={"verify_signature": False}
-            )
+            claims = KeycloakJwtDecoder._decode_claims(payload_b64)
+        except (ValueError, orjson.JSONDecodeError, binascii.Error) as e:
+            logger.error(f"Failed to decode JWT token: {str(e)}", exc_info=True)
+            raise UnauthorizedException(
+                message="Failed to decode JWT token",
+                process="token_decode"
+            ) from e
 
+        try:
+            missing: List[str] = []
             user = KeycloakUser(
-                username=KeycloakJwtDecoder._get_claim_as_string(claims, "preferred_username"),
-                keycloak_user_id=KeycloakJwtDecoder._get_claim_as_string(claims, "sid"),
-                tenant_id=KeycloakJwtDecoder._get_claim_as_string(claims, "tenantId"),
-                email=KeycloakJwtDecoder._get_claim_as_string(claims, "email"),
-                first_name=KeycloakJwtDecoder._get_claim_as_string(claims, "given_name"),
-                last_name=KeycloakJwtDecoder._get_claim_as_string(claims, "family_name"),
-                realm=KeycloakJwtDecoder._extract_realm(claims),
-                client_id=KeycloakJwtDecoder._get_claim_as_string(claims, "azp"),
-                roles=KeycloakJwtDecoder._extract_roles(claims),
-                email_verified=KeycloakJwtDecoder._get_claim_as_boolean(claims, "email_verified"),
+                username=KeycloakJwtDecoder._get_claim_as_string(claims, CLAIM_USERNAME, missing),
+                keycloak_user_id=KeycloakJwtDecoder._get_claim_as_string(claims, CLAIM_USER_ID, missing),
+                tenant_id=KeycloakJwtDecoder._get_claim_as_string(claims, CLAIM_TENANT_ID, missing),
+                email=KeycloakJwtDecoder._get_claim_as_string(claims, CLAIM_EMAIL, missing),
+                first_name=KeycloakJwtDecoder._get_claim_as_string(claims, CLAIM_FIRST_NAME, missing),
+                last_name=KeycloakJwtDecoder._get_claim_as_string(claims, CLAIM_LAST_NAME, missing),
+                realm=KeycloakJwtDecoder._extract_realm(claims, missing),
+                client_id=KeycloakJwtDecoder._get_claim_as_string(claims, CLAIM_CLIENT_ID, missing),
+                roles=KeycloakJwtDecoder._extract_roles(claims, missing),
+                email_verified=KeycloakJwtDecoder._get_claim_as_boolean(
+                    claims, CLAIM_EMAIL_VERIFIED, missing
+                ),
             )
+            # One warning per token instead of one per missing claim
+            if missing:
+                logger.warning("Claims not found in JWT token: {}", ", ".join(missing))
 
             logger.debug(f"Successfully decoded JWT token for user: {user.username}")
-            return user
 
-        except JWTError as e:
-            logger.error(f"Failed to decode JWT token: {str(e)}", exc_info=True)
-            raise UnauthorizedException(
-                message="Failed to decode JWT token",
-                process="token_decode"
-            ) from e
         except Exception as e:
             logger.error(f"Unexpected error decoding JWT token: {str(e)}", exc_info=True)
             raise UnauthorizedException(
@@ -94,67 +148,182 @@ class KeycloakJwtDecoder:
                 process="token_decode"
             ) from e
 
+        expires_at = KeycloakJwtDecoder._cache_user(cache_key, user, claims.get("exp"))
+        _current_user.set((token, user, expires_at))
+        return user
+
+    @staticmethod
+    def _decode_claims(payload_b64: str) -> dict:
+        """
+        Extract the claims from a JWT payload without verifying its signature.
+
+        The payload segment is base64url-decoded and parsed with orjson; the
+        exp and nbf claims are still enforced so expired tokens are rejected.
+
+        Args:
+            payload_b64: Base64url-encoded payload segment of the token
+
+        Returns:
+            JWT claims dictionary
+
+        Raises:
+            ValueError: If the payload is not a JSON object or a time claim is invalid
+            binascii.Error: If the payload is not valid base64url
+        """
+        claims = orjson.loads(
+            base64.urlsafe_b64decode(payload_b64 + "=" * (-len(payload_b64) % 4))
+        )
+        if not isinstance(claims, dict):
+            raise ValueError("JWT payload must be a JSON object")
+
+        now = time.time()
+        exp = claims.get("exp")
+        if exp is not None:
+            if not isinstance(exp, (int, float)) or isinstance(exp, bool):
+                raise ValueError("Expiration Time claim (exp) must be a number")
+            if exp < now:
+                raise ValueError("Token has expired")
+        nbf = claims.get("nbf")
+        if nbf is not None:
+            if not isinstance(nbf, (int, float)) or isinstance(nbf, bool):
+                raise ValueError("Not Before claim (nbf) must be a number")
+            if nbf > now:
+                raise ValueError("Token is not yet valid (nbf)")
+        return claims
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Remove all decoded users from the token cache (e.g. on logout)."""
+        with _token_cache_lock:
+            _token_cache.clear()
+        _current_user.set(None)
+
+    @staticmethod
+    def _cache_key(token: str) -> bytes:
+        """
+        Build the token cache key.
+
+        Args:
+            token: Normalized JWT token string
+
+        Returns:
+            16-byte BLAKE2b digest of the token
+        """
+        # surrogatepass: lone surrogates must not raise before the token is validated
+        return hashlib.blake2b(token.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+    @staticmethod
+    def _cache_user(cache_key: bytes, user: KeycloakUser, exp: object) -> Optional[float]:
+        """
+        Store a decoded user in the token cache.
+
+        Tokens that are already expired are not cached, and tokens with an exp
+        claim are only served from the cache until they expire.
+
+        Args:
+            cache_key: Cache key for the token
+            user: Decoded user
+            exp: Value of the token's exp claim (seconds since epoch), if any
+
+        Returns:
+            Time (seconds since epoch) after which the user must not be reused,
+            or None if the token has no exp claim
+        """
+        expires_at: Optional[float] = None
+        if isinstance(exp, (int, float)) and not isinstance(exp, bool):
+            expires_at = float(exp)
+            if expires_at <= time.time():
+                return expires_at
+
+        with _token_cache_lock:
+            _token_cache[cache_key] = (user, expires_at)
+        return expires_at
+
     @staticmethod
-    def _normalize_token(token: str) -> str:
+    def _parse_token(token: str) -> Tuple[str, str]:
         """
-        Remove Bearer prefix from token if present.
+        Remove the Bearer prefix and check the JWT format in a single pass.
+
+        The two separators are located with str.find (a memchr scan in
+        CPython), and the payload is sliced between them, so the token is
+        scanned once and no intermediate list is built.
 
         Args:
-            token: Token string
+            token: Token string (with or without "Bearer " prefix)
 
         Returns:
-            Token without Bearer prefix
+            Tuple of the token without Bearer prefix and its payload segment
+
+        Raises:
+            UnauthorizedException: If the token does not have 3 non-empty dot-separated parts
         """
         if token.startswith(KeycloakJwtDecoder.BEARER_PREFIX):
-            return token[len(KeycloakJwtDecoder.BEARER_PREFIX) :]
-        return token
+            token = token[KeycloakJwtDecoder.BEARER_PREFIX_LENGTH :]
+        header_end = token.find(".")
+        payload_end = token.find(".", header_end + 1) if header_end > 0 else -1
+        # Every part must be non-empty: header before the first dot, payload
+        # between the dots and signature after the second one
+        if (
+            payload_end <= header_end + 1
+            or payload_end == len(token) - 1
+            or token.find(".", payload_end + 1) >= 0
+        ):
+            logger.error("Invalid JWT format")
+            raise UnauthorizedException(
+                message="Invalid JWT format",
+                process="token_decode"
+            )
+        payload_b64 = token[header_end + 1 : payload_end]
+        return token, payload_b64
 
     @staticmethod
-    def _get_claim_as_string(claims: dict, claim_name: str) -> Optional[str]:
+    def _get_claim_as_string(
+        claims: dict, claim_name: str, missing: List[str]
+    ) -> Optional[str]:
         """
         Get a claim value as string.
 
         Args:
             claims: JWT claims dictionary
             claim_name: Name of the claim
+            missing: Names of missing claims; the claim is appended if not present
 
         Returns:
             Claim value as string, or None if not present
         """
         value = claims.get(claim_name)
         if value is None:
-            logger.warning(
-                f"Claim '{claim_name}' not found in JWT token. Setting to None."
-            )
+            missing.append(claim_name)
             return None
         return str(value) if not isinstance(value, str) else value
 
     @staticmethod
-    def _get_claim_as_boolean(claims: dict, claim_name: str) -> Optional[bool]:
+    def _get_claim_as_boolean(
+        claims: dict, claim_name: str, missing: List[str]
+    ) -> Optional[bool]:
         """
         Get a claim value as boolean.
 
         Args:
             claims: JWT claims dictionary
             claim_name: Name of the claim
+            missing: Names of missing claims; the claim is appended if not present
 
         Returns:
             Claim value as boolean, or None if not present
         """
         value = claims.get(claim_name)
         if value is None:
-            logger.warning(
-                f"Claim '{claim_name}' not found in JWT token. Setting to None."
-            )
+            missing.append(claim_name)
             return None
-        if isinstance(value, bool):
+        if value is True or value is False:
             return value
         if isinstance(value, str):
-            return value.lower() in ("true", "1", "yes")
+            return value.lower() in _TRUTHY_CLAIM_VALUES
         return bool(value)
 
     @staticmethod
-    def _extract_realm(claims: dict) -> Optional[str]:
+    def _extract_realm(claims: dict, missing: List[str]) -> Optional[str]:
         """
         Extract realm from JWT claims.
 
@@ -162,29 +331,29 @@ class KeycloakJwtDecoder:
 
         Args:
             claims: JWT claims dictionary
+            missing: Names of missing claims; "realm" is appended if not found
 
         Returns:
             Realm name, or None if not found
         """
         # Try to extract from issuer
         issuer = claims.get("iss")
-        if issuer and isinstance(issuer, str) and "/realms/" in issuer:
-            parts = issuer.split("/realms/")
-            if len(parts) > 1:
-                realm = parts[1].split("/")[0]
+        if issuer and isinstance(issuer, str):
+            _, separator, tail = issuer.partition(REALMS_PATH_SEPARATOR)
+            if separator:
+                realm, _, _ = tail.partition("/")
                 if realm:
                     return realm
 
         # Fallback to realm claim
         realm = claims.get("realm")
         if realm is None:
-            logger.warning(
-                "Realm not found in JWT token (neither in 'iss' nor 'realm' claim). Setting to None."
-            )
-        return str(realm) if realm is not None else None
+            missing.append("realm")
+            return None
+        return str(realm)
 
     @staticmethod
-    def _extract_roles(claims: dict) -> List[str]:
+    def _extract_roles(claims: dict, missing: List[str]) -> Tuple[str, ...]:
         """
         Extract roles from JWT claims.
 
@@ -192,59 +361,55 @@ class KeycloakJwtDecoder:
 
         Args:
             claims: JWT claims dictionary
+            missing: Names of missing claims; missing role claims are appended,
+                and "roles" if no role was found at all
 
         Returns:
-            List of role names
+            Tuple of role names
         """
-        roles: List[str] = []
-
         # Extract realm roles
+        realm_roles: Iterable = ()
         realm_access = claims.get("realm_access")
         if realm_access is None:
-            logger.warning(
-                "Claim 'realm_access' not found in JWT token. No realm roles will be extracted."
-            )
+            missing.append("realm_access")
         elif isinstance(realm_access, dict):
-            realm_roles = realm_access.get("roles")
-            if realm_roles is None:
-                logger.warning(
-                    "Field 'roles' not found in 'realm_access' claim. No realm roles will be extracted."
-                )
-            elif isinstance(realm_roles, list):
-                roles.extend([str(role) for role in realm_roles if role])
+            roles_claim = realm_access.get("roles")
+            if roles_claim is None:
+                missing.append("realm_access.roles")
+            elif isinstance(roles_claim, list):
+                realm_roles = roles_claim
 
         # Extract client roles (from resource_access)
         resource_access = claims.get("resource_access")
         if resource_access is None:
-            logger.warning(
-                "Claim 'resource_access' not found in JWT token. No client roles will be extracted."
-            )
-        elif isinstance(resource_access, dict):
-            for client_access in resource_access.values():
-                if isinstance(client_access, dict):
-                    client_roles = client_access.get("roles")
-                    if isinstance(client_roles, list):
-                        roles.extend([str(role) for role in client_roles if role])
+            missing.append("resource_access")
+
+        # Single pass over both sources; roles are almost always strings already
+        roles = tuple(
+            role if type(role) is str else str(role)
+            for role in chain(realm_roles, KeycloakJwtDecoder._iter_client_roles(resource_access))
+            if role
+        )
 
         if not roles:
-            logger.warning(
-                "No roles found in JWT token (checked 'realm_access' and 'resource_access'). Returning empty list."
-            )
+            missing.append("roles")
 
         return roles
 
     @staticmethod
-    def _is_valid_jwt_format(token: str) -> bool:
+    def _iter_client_roles(resource_access: object) -> Iterator:
         """
-        Check if token has valid JWT format (3 parts separated by dots).
+        Iterate over the client roles in the resource_access claim.
 
         Args:
-            token: Token string
+            resource_access: Value of the resource_access claim
 
-        Returns:
-            True if format is valid, False otherwise
+        Yields:
+            Role values of every client that declares a roles list
         """
-        normalized = KeycloakJwtDecoder._normalize_token(token)
-        parts = normalized.split(".")
-        return len(parts) == KeycloakJwtDecoder.JWT_PARTS_COUNT
-
+        if isinstance(resource_access, dict):
+            for client_access in resource_access.values():
+                if isinstance(client_access, dict):
+                    client_roles = client_access.get("roles")
+                    if isinstance(client_roles, list):
+                        yield from client_roles
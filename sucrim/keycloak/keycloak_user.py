@@ -1,60 +1,47 @@
 """Keycloak user model for representing authenticated users."""
 
-from typing import List, Optional
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional, Tuple
 
-from pydantic import BaseModel, Field
 
-
-class KeycloakUser(BaseModel):
+@dataclass(slots=True, frozen=True)
+class KeycloakUser:
     """
     Keycloak user model.
     
     Represents an authenticated user from Keycloak with all relevant information.
-    """
 
-    username: Optional[str] = Field(
-        default=None,
-        description="Username of the authenticated user"
-    )
-    keycloak_user_id: Optional[str] = Field(
-        default=None,
-        description="Keycloak user ID (UUID)"
-    )
-    tenant_id: Optional[str] = Field(
-        default=None,
-        description="Tenant ID for multi-tenant applications"
-    )
-    email: Optional[str] = Field(
-        default=None,
-        description="User email address"
-    )
-    first_name: Optional[str] = Field(
-        default=None,
-        description="User first name"
-    )
-    last_name: Optional[str] = Field(
-        default=None,
-        description="User last name"
-    )
-    realm: Optional[str] = Field(
-        default=None,
-        description="Keycloak realm name"
-    )
-    client_id: Optional[str] = Field(
-        default=None,
-        description="Keycloak client ID"
-    )
-    roles: List[str] = Field(
-        default_factory=list,
-        description="List of user roles"
-    )
-    email_verified: Optional[bool] = Field(
-        default=None,
-        description="Whether the user's email is verified"
-    )
-
-    class Config:
-        """Pydantic configuration."""
-
-        from_attributes = True
+    Attributes:
+        username: Username of the authenticated user
+        keycloak_user_id: Keycloak user ID (UUID)
+        tenant_id: Tenant ID for multi-tenant applications
+        email: User email address
+        first_name: User first name
+        last_name: User last name
+        realm: Keycloak realm name
+        client_id: Keycloak client ID
+        roles: Tuple of user roles
+        email_verified: Whether the user's email is verified
+    """
 
+    username: Optional[str] = None
+    keycloak_user_id: Optional[str] = None
+    tenant_id: Optional[str] = None
+    email: Optional[str] = None
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    realm: Optional[str] = None
+    client_id: Optional[str] = None
+    roles: Tuple[str, ...] = ()
+    email_verified: Optional[bool] = None
+
+    def model_dump(self) -> Dict[str, Any]:
+        """
+        Convert the user to a dictionary.
+
+        Kept for callers written against the former pydantic model.
+
+        Returns:
+            Dictionary with every field of the user
+        """
+        return asdict(self)
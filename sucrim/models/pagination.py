@@ -31,8 +31,10 @@ class Pagination(BaseModel):
 
     def model_post_init(self, __context) -> None:
         """Calculate total_pages after total_elements is set."""
-        if self.total_elements is not None and self.page_size > 0:
-            self.total_pages = (self.total_elements + self.page_size - 1) // self.page_size
+        total = self.total_elements
+        # page_size can bypass validation (assignment, model_construct)
+        if total is not None and self.page_size > 0:
+            self.total_pages = -(-total // self.page_size)  # ceiling division
 
     def set_total_elements(self, total: int) -> None:
         """
@@ -43,10 +45,11 @@ class Pagination(BaseModel):
         """
         self.total_elements = total
         if self.page_size > 0:
-            self.total_pages = (total + self.page_size - 1) // self.page_size
+            self.total_pages = -(-total // self.page_size)  # ceiling division
 
     class Config:
         """Pydantic configuration."""
 
         frozen = False  # Allow mutation for setting total_elements
+        defer_build = True  # Build the validator on first use, not at import
 
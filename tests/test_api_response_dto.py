@@ -0,0 +1,96 @@
+"""Tests for ApiResponseDto class."""
+
+from pydantic import BaseModel
+
+from sucrim.http.response import ApiResponseDto
+from sucrim.models import Pagination
+
+
+class Item(BaseModel):
+    """Sample payload model."""
+
+    name: str
+
+
+class TestApiResponseDto:
+    """Test cases for ApiResponseDto."""
+
+    def test_ok_wraps_data(self):
+        """Test that ok() wraps data without pagination."""
+        response = ApiResponseDto.ok({"message": "Success"})
+
+        assert response.data == {"message": "Success"}
+        assert response.pagination is None
+
+    def test_ok_with_pagination_keeps_pagination(self):
+        """Test that ok_with_pagination() returns the given pagination."""
+        pagination = Pagination(page=2, page_size=10)
+
+        response = ApiResponseDto.ok_with_pagination([1, 2, 3], pagination)
+
+        assert response.data == [1, 2, 3]
+        assert response.pagination is pagination
+
+    def test_ok_from_page_sets_totals(self):
+        """Test that ok_from_page() calculates total_pages from total_elements."""
+        pagination = Pagination(page=1, page_size=10)
+
+        response = ApiResponseDto.ok_from_page([1, 2, 3], pagination, total_elements=25)
+
+        assert response.pagination.total_elements == 25
+        assert response.pagination.total_pages == 3
+        assert response.pagination.page_size == 10
+
+    def test_ok_from_page_does_not_modify_input_pagination(self):
+        """Test that ok_from_page() leaves the caller's pagination untouched."""
+        pagination = Pagination(page=1, page_size=10)
+
+        ApiResponseDto.ok_from_page([1, 2, 3], pagination, total_elements=25)
+
+        assert pagination.total_elements is None
+        assert pagination.total_pages is None
+
+    def test_ok_from_page_without_total_elements(self):
+        """Test that ok_from_page() keeps pagination as-is without total_elements."""
+        pagination = Pagination(page=1, page_size=10)
+
+        response = ApiResponseDto.ok_from_page([1, 2, 3], pagination)
+
+        assert response.pagination is pagination
+
+    def test_ok_from_page_with_unvalidated_zero_page_size(self):
+        """Test that ok_from_page() leaves total_pages unset when page_size is 0."""
+        pagination = Pagination.model_construct(page=1, page_size=0)
+
+        response = ApiResponseDto.ok_from_page([], pagination, total_elements=25)
+
+        assert response.pagination.total_elements == 25
+        assert response.pagination.total_pages is None
+
+    def test_set_total_elements_with_assigned_zero_page_size(self):
+        """Test that set_total_elements() tolerates page_size assigned to 0."""
+        pagination = Pagination(page=1, page_size=10)
+        pagination.page_size = 0
+
+        pagination.set_total_elements(25)
+
+        assert pagination.total_elements == 25
+        assert pagination.total_pages is None
+
+    def test_response_serializes_pagination(self):
+        """Test that the response dumps data and pagination fields."""
+        pagination = Pagination(page=1, page_size=10)
+
+        response = ApiResponseDto.ok_from_page([1], pagination, total_elements=1)
+
+        assert response.model_dump()["pagination"]["total_pages"] == 1
+
+    def test_parametrized_response_validates_data(self):
+        """Test that ApiResponseDto[T] is cached and validates data as T."""
+        response_model = ApiResponseDto[Item]
+
+        response = response_model(data={"name": "item"})
+
+        assert ApiResponseDto[Item] is response_model
+        assert isinstance(response.data, Item)
+        assert response_model.model_config["defer_build"] is True
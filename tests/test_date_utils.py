@@ -5,6 +5,7 @@ from zoneinfo import ZoneInfo
 
 import pytest
 
+from sucrim.utils import date_utils
 from sucrim.utils.date_utils import DateUtils, MEXICO_TIMEZONE
 
 
@@ -100,3 +101,13 @@ class TestDateUtils:
         # The hour difference should be consistent (UTC-6 for Mexico)
         assert abs((back_to_utc - original).total_seconds()) < 3600  # Within 1 hour
 
+    def test_date_utils_methods_are_module_functions(self):
+        """Test that DateUtils forwards to the module-level functions."""
+        assert DateUtils.now is date_utils.now
+        assert DateUtils.today is date_utils.today
+        assert DateUtils.to_mexico_timezone is date_utils.to_mexico_timezone
+        assert DateUtils.from_mexico_timezone is date_utils.from_mexico_timezone
+
+    def test_now_is_documented(self):
+        """Test that now keeps a docstring for help() and IDEs."""
+        assert "current datetime in Mexico timezone" in date_utils.now.__doc__
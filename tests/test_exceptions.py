@@ -1,5 +1,7 @@
 """Tests for exception classes."""
 
+import pickle
+
 import pytest
 
 from sucrim.http.errors import (
@@ -30,7 +32,7 @@ class TestBusinessExceptionBase:
         assert exc.message == "Test error"
         assert exc.process == "test_process"
         assert exc.status_code == 500
-        assert exc.errors == []
+        assert exc.errors == ()
 
     def test_business_exception_with_errors(self):
         """Test business exception with error details."""
@@ -70,6 +72,12 @@ class TestBusinessExceptionBase:
         assert result["process"] == "test_process"
         assert result["errors"] == errors
 
+    def test_business_exception_to_dict_is_cached(self):
+        """Test that to_dict returns the same dictionary on repeated calls."""
+        exc = BusinessException(message="Test error", process="test_process")
+
+        assert exc.to_dict() is exc.to_dict()
+
     def test_business_exception_inherits_from_exception(self):
         """Test that business exception inherits from Exception."""
         exc = BusinessException(
@@ -79,6 +87,37 @@ class TestBusinessExceptionBase:
 
         assert isinstance(exc, Exception)
 
+    def test_business_exception_pickle_round_trip(self):
+        """Test that pickling preserves the slot attributes."""
+        exc = BusinessException(
+            message="Test error",
+            process="test_process",
+            status_code=409,
+            errors=[{"field": "id"}],
+        )
+
+        restored = pickle.loads(pickle.dumps(exc))
+
+        assert type(restored) is BusinessException
+        assert restored.message == "Test error"
+        assert restored.process == "test_process"
+        assert restored.status_code == 409
+        assert restored.errors == [{"field": "id"}]
+        assert str(restored) == "test_process: Test error"
+        assert restored.to_dict() == exc.to_dict()
+
+    def test_status_exception_pickle_round_trip(self):
+        """Test that pickling a status subclass keeps its custom process."""
+        exc = NotFoundException("Gone", process="Order Lookup", errors=["order 1"])
+
+        restored = pickle.loads(pickle.dumps(exc))
+
+        assert type(restored) is NotFoundException
+        assert restored.process == "Order Lookup"
+        assert restored.status_code == 404
+        assert restored.errors == ["order 1"]
+        assert str(restored) == "Order Lookup: Gone"
+
 
 class TestBadRequestException:
     """Test cases for BadRequestException."""
@@ -1,222 +1,260 @@
 """Tests for HTTP exception handlers."""
 
+import asyncio
+import json
+
 import pytest
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.testclient import TestClient
-from jose import ExpiredSignatureError
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+
+# The handlers module imports python-jose; skip the module cleanly when it is absent
+jose = pytest.importorskip("jose")
+ExpiredSignatureError = jose.ExpiredSignatureError
+
+from fastapi import APIRouter, FastAPI, HTTPException, Request  # noqa: E402
 
-from sucrim.http.errors import (
+from sucrim.http.errors import (  # noqa: E402
     BadRequestException,
     BusinessException,
     InternalServerErrorException,
     NotFoundException,
     UnauthorizedException,
 )
-from sucrim.http.exception_handlers import setup_exception_handlers
+from sucrim.http.exception_handlers import setup_exception_handlers  # noqa: E402
+
+# Expected response bodies, built once at import
+EXPECTED_BAD_REQUEST = {
+    "message": "Invalid request",
+    "process": "test_process",
+    "errors": [{"field": "id", "message": "Invalid format"}],
+}
+EXPECTED_NOT_FOUND = {"message": "Resource not found", "process": "resource_lookup", "errors": []}
+EXPECTED_UNAUTHORIZED = {"message": "Not authenticated", "process": "Authentication", "errors": []}
+EXPECTED_INTERNAL_ERROR = {
+    "message": "Internal server error",
+    "process": "database_operation",
+    "errors": [],
+}
+EXPECTED_BAD_REQUEST_DEFAULT = {
+    "message": "Bad request",
+    "process": "Processing Client Request",
+    "errors": [],
+}
+EXPECTED_NOT_FOUND_DEFAULT = {"message": "Not found", "process": "Resource Lookup", "errors": []}
+EXPECTED_INTERNAL_ERROR_DEFAULT = {
+    "message": "Internal error",
+    "process": "Internal Server Error",
+    "errors": [],
+}
+EXPECTED_EXPIRED_TOKEN = {
+    "message": "Token has expired.",
+    "process": "access_token",
+    "errors": None,
+}
+EXPECTED_HTTP_BAD_REQUEST = {"message": "Bad request", "process": "general_error", "errors": None}
+EXPECTED_NOT_AUTHORIZED = {
+    "message": "You are not authorized to perform this action",
+    "process": "general_error",
+    "errors": None,
+}
+EXPECTED_UNEXPECTED_ERROR = {
+    "message": "An unexpected error occurred",
+    "process": "internal_error",
+    "errors": None,
+}
+EXPECTED_EMPTY_ERRORS = {
+    "message": "Test error",
+    "process": "Processing Client Request",
+    "errors": [],
+}
+EXPECTED_NONE_ERRORS = {
+    "message": "Test error",
+    "process": "Processing Client Request",
+    "errors": None,
+}
+
+# Minimal request handed to the handlers; none of them read it
+REQUEST = Request({"type": "http", "method": "GET", "headers": [], "path": "/"})
+
+# Endpoints for the end-to-end checks, built once and mounted on the shared app
+router = APIRouter(prefix="/raise")
+
+
+@router.get("/bad_request")
+async def raise_bad_request():
+    raise BadRequestException(
+        message="Invalid request",
+        process="test_process",
+        errors=[{"field": "id", "message": "Invalid format"}],
+    )
+
+
+@router.get("/generic")
+async def raise_generic():
+    raise ValueError("Unexpected error")
+
+
+@pytest.fixture(scope="session")
+def app():
+    """Create a FastAPI app with exception handlers and the test router, shared by every test."""
+    app = FastAPI()
+    setup_exception_handlers(app)
+    app.include_router(router)
+    return app
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client(app):
+    """Create an async client that calls the app in-process, shared by every test.
+
+    Requests run on the session event loop through ASGITransport, with no
+    TestClient portal thread in between.
+    """
+    transport = ASGITransport(app=app, raise_app_exceptions=False)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def handle(app):
+    """Run the handler registered for an exception and return (status code, JSON body).
+
+    The handler is resolved through the exception's MRO, the same way Starlette does.
+    """
+
+    def _handle(exc: Exception):
+        handler = next(
+            app.exception_handlers[cls]
+            for cls in type(exc).__mro__
+            if cls in app.exception_handlers
+        )
+        response = asyncio.run(handler(REQUEST, exc))
+        return response.status_code, json.loads(response.body)
+
+    return _handle
 
 
 class TestExceptionHandlers:
     """Test cases for exception handlers."""
 
-    @pytest.fixture
-    def app(self):
-        """Create a FastAPI app with exception handlers."""
-        app = FastAPI()
-        setup_exception_handlers(app)
-        return app
-
-    @pytest.fixture
-    def client(self, app):
-        """Create a test client."""
-        return TestClient(app, raise_server_exceptions=False)
-
-    def test_business_exception_handler(self, app, client):
-        """Test handler for BusinessException."""
-
-        @app.get("/test-base-exception")
-        async def test_endpoint():
-            raise BadRequestException(
-                message="Invalid request",
-                process="test_process",
-                errors=[{"field": "id", "message": "Invalid format"}],
-            )
-
-        response = client.get("/test-base-exception")
-
-        assert response.status_code == 400
-        data = response.json()
-        assert data["message"] == "Invalid request"
-        assert data["process"] == "test_process"
-        assert data["errors"] == [{"field": "id", "message": "Invalid format"}]
-
-    def test_not_found_exception_handler(self, app, client):
-        """Test handler for NotFoundException."""
-
-        @app.get("/test-not-found")
-        async def test_endpoint():
-            raise NotFoundException(
-                message="Resource not found",
-                process="resource_lookup",
-            )
-
-        response = client.get("/test-not-found")
-
-        assert response.status_code == 404
-        data = response.json()
-        assert data["message"] == "Resource not found"
-        assert data["process"] == "resource_lookup"
-        assert data["errors"] == []
-
-    def test_unauthorized_exception_handler(self, app, client):
-        """Test handler for UnauthorizedException."""
-
-        @app.get("/test-unauthorized")
-        async def test_endpoint():
-            raise UnauthorizedException(message="Not authenticated")
-
-        response = client.get("/test-unauthorized")
-
-        assert response.status_code == 401
-        data = response.json()
-        assert data["message"] == "Not authenticated"
-        assert data["process"] == "Authentication"
-
-    def test_internal_server_error_exception_handler(self, app, client):
-        """Test handler for InternalServerErrorException."""
-
-        @app.get("/test-internal-error")
-        async def test_endpoint():
-            raise InternalServerErrorException(
-                message="Internal server error",
-                process="database_operation",
-            )
-
-        response = client.get("/test-internal-error")
-
-        assert response.status_code == 500
-        data = response.json()
-        assert data["message"] == "Internal server error"
-        assert data["process"] == "database_operation"
-
-    def test_expired_token_handler(self, app, client):
+    @pytest.mark.parametrize(
+        ("exc", "status", "expected"),
+        [
+            (
+                BadRequestException(
+                    message="Invalid request",
+                    process="test_process",
+                    errors=[{"field": "id", "message": "Invalid format"}],
+                ),
+                400,
+                EXPECTED_BAD_REQUEST,
+            ),
+            (
+                NotFoundException(message="Resource not found", process="resource_lookup"),
+                404,
+                EXPECTED_NOT_FOUND,
+            ),
+            (UnauthorizedException(message="Not authenticated"), 401, EXPECTED_UNAUTHORIZED),
+            (
+                InternalServerErrorException(
+                    message="Internal server error",
+                    process="database_operation",
+                ),
+                500,
+                EXPECTED_INTERNAL_ERROR,
+            ),
+            (BadRequestException(message="Bad request"), 400, EXPECTED_BAD_REQUEST_DEFAULT),
+            (NotFoundException(message="Not found"), 404, EXPECTED_NOT_FOUND_DEFAULT),
+            (
+                InternalServerErrorException(message="Internal error"),
+                500,
+                EXPECTED_INTERNAL_ERROR_DEFAULT,
+            ),
+        ],
+        ids=[
+            "business",
+            "not_found",
+            "unauthorized",
+            "internal_server_error",
+            "bad_request_default",
+            "not_found_default",
+            "internal_server_error_default",
+        ],
+    )
+    def test_business_exception_handler(self, handle, exc, status, expected):
+        """Test that business exceptions map to their status code and body."""
+        status_code, data = handle(exc)
+
+        assert status_code == status
+        assert data == expected
+
+    def test_expired_token_handler(self, handle):
         """Test handler for ExpiredSignatureError."""
+        status_code, data = handle(ExpiredSignatureError("Token has expired"))
 
-        @app.get("/test-expired-token")
-        async def test_endpoint():
-            raise ExpiredSignatureError("Token has expired")
+        assert status_code == 401
+        assert data == EXPECTED_EXPIRED_TOKEN
 
-        response = client.get("/test-expired-token")
-
-        assert response.status_code == 401
-        data = response.json()
-        assert data["message"] == "Token has expired."
-        assert data["process"] == "access_token"
-        assert data["errors"] is None
-
-    def test_http_exception_handler(self, app, client):
+    def test_http_exception_handler(self, handle):
         """Test handler for FastAPI HTTPException."""
+        status_code, data = handle(HTTPException(status_code=400, detail="Bad request"))
 
-        @app.get("/test-http-exception")
-        async def test_endpoint():
-            raise HTTPException(status_code=400, detail="Bad request")
-
-        response = client.get("/test-http-exception")
-
-        assert response.status_code == 400
-        data = response.json()
-        assert data["message"] == "Bad request"
-        assert data["process"] == "general_error"
-        assert data["errors"] is None
+        assert status_code == 400
+        assert data == EXPECTED_HTTP_BAD_REQUEST
 
-    def test_http_exception_forbidden_with_specific_message(self, app, client):
+    def test_http_exception_forbidden_with_specific_message(self, handle):
         """Test handler for HTTPException 403 with specific message."""
-
-        @app.get("/test-forbidden-specific")
-        async def test_endpoint():
-            raise HTTPException(
+        status_code, data = handle(
+            HTTPException(
                 status_code=403,
                 detail="User is required to perform this action",
             )
+        )
 
-        response = client.get("/test-forbidden-specific")
-
-        assert response.status_code == 403
-        data = response.json()
-        assert data["message"] == "You are not authorized to perform this action"
-        assert data["process"] == "general_error"
+        assert status_code == 403
+        assert data == EXPECTED_NOT_AUTHORIZED
 
-    def test_generic_exception_handler(self, app, client):
+    def test_generic_exception_handler(self, handle):
         """Test handler for generic exceptions."""
+        status_code, data = handle(ValueError("Unexpected error"))
 
-        @app.get("/test-generic-exception")
-        async def test_endpoint():
-            raise ValueError("Unexpected error")
-
-        response = client.get("/test-generic-exception")
-
-        assert response.status_code == 500
-        data = response.json()
-        assert data["message"] == "An unexpected error occurred"
-        assert data["process"] == "internal_error"
-        assert data["errors"] is None
+        assert status_code == 500
+        assert data == EXPECTED_UNEXPECTED_ERROR
 
-    def test_exception_handler_with_empty_errors(self, app, client):
+    def test_exception_handler_with_empty_errors(self, handle):
         """Test exception handler with empty errors list."""
+        status_code, data = handle(BadRequestException(message="Test error", errors=[]))
 
-        @app.get("/test-empty-errors")
-        async def test_endpoint():
-            raise BadRequestException(
-                message="Test error",
-                errors=[],
-            )
-
-        response = client.get("/test-empty-errors")
+        assert status_code == 400
+        assert data == EXPECTED_EMPTY_ERRORS
 
-        assert response.status_code == 400
-        data = response.json()
-        assert data["errors"] == []
-
-    def test_exception_handler_with_none_errors(self, app, client):
+    def test_exception_handler_with_none_errors(self, handle):
         """Test exception handler with None errors."""
+        exc = BadRequestException(message="Test error")
+        exc.errors = None
 
-        @app.get("/test-none-errors")
-        async def test_endpoint():
-            exc = BadRequestException(message="Test error")
-            exc.errors = None
-            raise exc
-
-        response = client.get("/test-none-errors")
+        status_code, data = handle(exc)
 
-        assert response.status_code == 400
-        data = response.json()
-        # When errors is None, it should be converted to empty list or None
-        # Based on the handler implementation, it should be None
-        assert data["errors"] is None or data["errors"] == []
-
-    def test_multiple_exception_types(self, app, client):
-        """Test that different exception types are handled correctly."""
-
-        @app.get("/test-400")
-        async def test_400():
-            raise BadRequestException(message="Bad request")
+        assert status_code == 400
+        assert data == EXPECTED_NONE_ERRORS
 
-        @app.get("/test-404")
-        async def test_404():
-            raise NotFoundException(message="Not found")
 
-        @app.get("/test-500")
-        async def test_500():
-            raise InternalServerErrorException(message="Internal error")
+class TestExceptionHandlersOverHttp:
+    """End-to-end checks that the handlers are wired into the app."""
 
-        response_400 = client.get("/test-400")
-        response_404 = client.get("/test-404")
-        response_500 = client.get("/test-500")
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_business_exception_response(self, client):
+        """Test that a raised BusinessException reaches the client as JSON."""
+        response = await client.get("/raise/bad_request")
 
-        assert response_400.status_code == 400
-        assert response_404.status_code == 404
-        assert response_500.status_code == 500
+        assert response.status_code == 400
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == EXPECTED_BAD_REQUEST
 
-        assert response_400.json()["message"] == "Bad request"
-        assert response_404.json()["message"] == "Not found"
-        assert response_500.json()["message"] == "Internal error"
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_generic_exception_response(self, client):
+        """Test that an unexpected exception is turned into a 500 JSON response."""
+        response = await client.get("/raise/generic")
 
+        assert response.status_code == 500
+        assert response.json() == EXPECTED_UNEXPECTED_ERROR
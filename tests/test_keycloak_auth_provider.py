@@ -0,0 +1,206 @@
+"""Tests for Keycloak authentication provider."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+import sucrim.keycloak.keycloak_auth_provider as auth_module
+from sucrim.keycloak.keycloak_auth_provider import KeycloakAuthProvider, get_auth_provider
+from sucrim.keycloak.keycloak_config import KeycloakConfig
+
+TOKEN_URL = "https://keycloak.example.com/realms/test-realm/protocol/openid-connect/token"
+
+
+@pytest.fixture
+def token_requests(monkeypatch):
+    """Route every httpx client to a mock Keycloak token endpoint and record requests."""
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(
+            200,
+            json={"access_token": f"token-{len(requests)}", "expires_in": 300},
+        )
+
+    transport = httpx.MockTransport(handler)
+    real_client = httpx.Client
+    monkeypatch.setattr(
+        httpx, "Client", lambda **kwargs: real_client(transport=transport, **kwargs)
+    )
+    return requests
+
+
+@pytest.fixture
+def config():
+    """Create a Keycloak configuration for the mock server."""
+    return KeycloakConfig(
+        server_url="https://keycloak.example.com",
+        client_id="test-client",
+        client_secret="test-secret",
+        realm="test-realm",
+    )
+
+
+@pytest.fixture
+def provider(token_requests, config):
+    """Create an auth provider against the mock token endpoint."""
+    return KeycloakAuthProvider(config)
+
+
+class TestKeycloakAuthProvider:
+    """Test cases for KeycloakAuthProvider."""
+
+    def test_initialize_fetches_token(self, provider, token_requests):
+        """Test that initialization requests an admin token."""
+        assert len(token_requests) == 1
+        assert str(token_requests[0].url) == TOKEN_URL
+        assert provider.get_admin_access_token() == "token-1"
+
+    def test_refresh_reuses_sync_client(self, provider, token_requests):
+        """Test that token refreshes share one pooled client."""
+        client = provider._sync_client
+
+        provider._refresh_token()
+
+        assert provider._sync_client is client
+        assert len(token_requests) == 2
+        assert provider.get_admin_access_token() == "token-2"
+
+    def test_get_admin_access_token_reuses_valid_token(self, provider, token_requests):
+        """Test that a valid token is returned without another request."""
+        provider.get_admin_access_token()
+        provider.get_admin_access_token()
+
+        assert len(token_requests) == 1
+
+    def test_get_admin_access_token_refreshes_expired_token(self, provider, token_requests):
+        """Test that an expired token is refreshed."""
+        provider._token_expires_at = 0.0
+
+        assert provider.get_admin_access_token() == "token-2"
+        assert len(token_requests) == 2
+
+    def test_get_admin_access_token_reconnects_after_interval(self, provider, token_requests):
+        """Test that reconnecting refreshes the token and keeps the HTTP clients open."""
+        client = provider._client
+        sync_client = provider._sync_client
+        provider._last_init_time -= KeycloakAuthProvider.RECONNECT_INTERVAL_SECONDS + 1
+
+        assert provider.get_admin_access_token() == "token-2"
+        assert len(token_requests) == 2
+        assert provider._client is client
+        assert provider._sync_client is sync_client
+        assert not client.is_closed
+        assert not sync_client.is_closed
+
+    def test_get_client_reconnect_keeps_request_in_flight(self, monkeypatch, token_requests, config):
+        """Test that a reconnect does not break a request still using the client."""
+        real_async_client = httpx.AsyncClient
+
+        async def run():
+            started = asyncio.Event()
+            release = asyncio.Event()
+
+            async def handler(request: httpx.Request) -> httpx.Response:
+                started.set()
+                await release.wait()
+                return httpx.Response(200, json={"ok": True})
+
+            transport = httpx.MockTransport(handler)
+            monkeypatch.setattr(
+                httpx,
+                "AsyncClient",
+                lambda **kwargs: real_async_client(transport=transport, **kwargs),
+            )
+            provider = KeycloakAuthProvider(config)
+
+            used_clients = []
+
+            async def slow_request():
+                client = await provider.get_client()
+                used_clients.append(client)
+                return await client.get("https://keycloak.example.com/admin/users")
+
+            request_task = asyncio.create_task(slow_request())
+            await started.wait()
+
+            provider._last_init_time -= KeycloakAuthProvider.RECONNECT_INTERVAL_SECONDS + 1
+            reconnected_client = await provider.get_client()
+            release.set()
+            response = await request_task
+
+            assert response.status_code == 200
+            assert reconnected_client is used_clients[0]
+            assert not used_clients[0].is_closed
+            await provider.close()
+
+        asyncio.run(run())
+
+        assert len(token_requests) == 2
+
+    def test_get_admin_access_token_string_adds_bearer_prefix(self, provider):
+        """Test that the token string includes the Bearer prefix."""
+        assert provider.get_admin_access_token_string() == "Bearer token-1"
+
+    def test_get_admin_auth_headers_follow_token_refresh(self, provider):
+        """Test that the Authorization header is rebuilt when the token is refreshed."""
+        assert provider.get_admin_auth_headers() == {"Authorization": "Bearer token-1"}
+
+        provider._token_expires_at = 0.0
+
+        assert provider.get_admin_auth_headers() == {"Authorization": "Bearer token-2"}
+        assert provider.get_admin_access_token_string() == "Bearer token-2"
+
+    def test_close_closes_clients(self, provider):
+        """Test that close releases both HTTP clients."""
+        sync_client = provider._sync_client
+
+        asyncio.run(provider.close())
+
+        assert sync_client.is_closed
+        assert provider._client is None
+        assert provider._sync_client is None
+
+
+class TestGetAuthProvider:
+    """Test cases for get_auth_provider function."""
+
+    def test_get_auth_provider_returns_singleton(self, monkeypatch, token_requests, config):
+        """Test that get_auth_provider builds the provider once and reuses it."""
+        monkeypatch.setattr(auth_module, "_auth_provider", None)
+        monkeypatch.setattr(auth_module, "get_keycloak_config", lambda: config)
+
+        provider1 = get_auth_provider()
+        provider2 = get_auth_provider()
+
+        assert provider1 is provider2
+        assert provider1.config is config
+        assert len(token_requests) == 1
+
+    def test_get_auth_provider_builds_once_across_threads(self, monkeypatch, config):
+        """Test that concurrent first calls share a single provider."""
+        monkeypatch.setattr(auth_module, "_auth_provider", None)
+        monkeypatch.setattr(auth_module, "get_keycloak_config", lambda: config)
+        built = []
+
+        def slow_init(self):
+            time.sleep(0.05)  # Widen the check-then-set window
+            built.append(self)
+
+        monkeypatch.setattr(KeycloakAuthProvider, "_initialize", slow_init)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(get_auth_provider()))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(built) == 1
+        assert all(result is built[0] for result in results)
@@ -0,0 +1,252 @@
+"""Tests for Keycloak JWT decoder."""
+
+import base64
+import contextvars
+import json
+import time
+
+import pytest
+from loguru import logger
+
+import sucrim.keycloak.keycloak_jwt_decoder as decoder_module
+from sucrim.http.errors import UnauthorizedException
+from sucrim.keycloak.keycloak_jwt_decoder import KeycloakJwtDecoder
+
+
+def _b64url(data: dict) -> str:
+    """Encode a dictionary as an unpadded base64url JSON segment."""
+    return base64.urlsafe_b64encode(json.dumps(data).encode()).rstrip(b"=").decode()
+
+
+def make_token(claims: dict) -> str:
+    """Build an unsigned JWT carrying the given claims."""
+    return f"{_b64url({'alg': 'RS256', 'typ': 'JWT'})}.{_b64url(claims)}.c2lnbmF0dXJl"
+
+
+CLAIMS = {
+    "preferred_username": "jdoe",
+    "sid": "session-1",
+    "tenantId": "tenant-1",
+    "email": "jdoe@example.com",
+    "given_name": "John",
+    "family_name": "Doe",
+    "iss": "https://keycloak.example.com/realms/test-realm",
+    "azp": "test-client",
+    "realm_access": {"roles": ["admin", "user"]},
+    "resource_access": {"test-client": {"roles": ["reader"]}},
+    "email_verified": True,
+}
+
+
+@pytest.fixture(autouse=True)
+def _clear_token_cache():
+    """Start every test with an empty token cache."""
+    KeycloakJwtDecoder.clear_cache()
+    yield
+    KeycloakJwtDecoder.clear_cache()
+
+
+class TestKeycloakJwtDecoder:
+    """Test cases for KeycloakJwtDecoder."""
+
+    def test_decode_token_extracts_claims(self):
+        """Test that user information is extracted from the token claims."""
+        user = KeycloakJwtDecoder.decode_token(make_token(CLAIMS))
+
+        assert user.username == "jdoe"
+        assert user.keycloak_user_id == "session-1"
+        assert user.tenant_id == "tenant-1"
+        assert user.email == "jdoe@example.com"
+        assert user.first_name == "John"
+        assert user.last_name == "Doe"
+        assert user.realm == "test-realm"
+        assert user.client_id == "test-client"
+        assert user.roles == ("admin", "user", "reader")
+        assert user.email_verified is True
+
+    def test_decode_token_extracts_roles(self):
+        """Test that realm and client roles are merged, stringified and filtered."""
+        claims = {
+            **CLAIMS,
+            "realm_access": {"roles": ["admin", 7, "", None]},
+            "resource_access": {
+                "client-a": {"roles": ["reader"]},
+                "client-b": {"roles": "not-a-list"},
+                "client-c": "not-a-dict",
+            },
+        }
+
+        user = KeycloakJwtDecoder.decode_token(make_token(claims))
+
+        assert user.roles == ("admin", "7", "reader")
+
+    def test_decode_token_without_role_claims(self):
+        """Test that missing role claims produce an empty role list."""
+        claims = {key: value for key, value in CLAIMS.items() if not key.endswith("_access")}
+
+        user = KeycloakJwtDecoder.decode_token(make_token(claims))
+
+        assert user.roles == ()
+
+    @pytest.mark.parametrize(
+        ("claims", "expected"),
+        [
+            ({"iss": "https://kc.example.com/realms/main/protocol"}, "main"),
+            ({"iss": "https://kc.example.com/realms/", "realm": "fallback"}, "fallback"),
+            ({"iss": "https://kc.example.com/auth", "realm": "fallback"}, "fallback"),
+            ({"iss": 42}, None),
+        ],
+    )
+    def test_extract_realm(self, claims, expected):
+        """Test that the realm is read from the issuer, falling back to the realm claim."""
+        assert KeycloakJwtDecoder._extract_realm(claims, []) == expected
+
+    def test_decode_token_warns_once_for_missing_claims(self):
+        """Test that all missing claims are reported in a single warning."""
+        warnings = []
+        sink_id = logger.add(warnings.append, level="WARNING", format="{message}")
+        try:
+            KeycloakJwtDecoder.decode_token(make_token({"preferred_username": "jdoe"}))
+        finally:
+            logger.remove(sink_id)
+
+        assert len(warnings) == 1
+        assert "tenantId" in warnings[0]
+        assert "realm_access" in warnings[0]
+
+    def test_decode_token_reports_missing_roles(self):
+        """Test that a token without any role is included in the missing-claims warning."""
+        claims = {key: value for key, value in CLAIMS.items() if not key.endswith("_access")}
+        warnings = []
+        sink_id = logger.add(warnings.append, level="WARNING", format="{message}")
+        try:
+            KeycloakJwtDecoder.decode_token(make_token(claims))
+        finally:
+            logger.remove(sink_id)
+
+        assert len(warnings) == 1
+        assert warnings[0].rstrip().endswith(", roles")
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [(True, True), (False, False), ("TRUE", True), ("yes", True), ("no", False), (1, True), (0, False)],
+    )
+    def test_get_claim_as_boolean(self, value, expected):
+        """Test that boolean claims accept booleans, truthy strings and numbers."""
+        assert KeycloakJwtDecoder._get_claim_as_boolean({"flag": value}, "flag", []) is expected
+
+    def test_decode_token_accepts_bearer_prefix(self):
+        """Test that a Bearer prefix is stripped before decoding."""
+        user = KeycloakJwtDecoder.decode_token("Bearer " + make_token(CLAIMS))
+
+        assert user.username == "jdoe"
+
+    def test_decode_token_returns_cached_user(self):
+        """Test that decoding the same token twice returns the cached user."""
+        token = make_token(CLAIMS)
+
+        assert KeycloakJwtDecoder.decode_token(token) is KeycloakJwtDecoder.decode_token(token)
+
+    def test_cached_user_roles_cannot_be_modified(self):
+        """Test that callers cannot change the roles of a user shared through the cache."""
+        token = make_token(CLAIMS)
+        user = KeycloakJwtDecoder.decode_token(token)
+
+        with pytest.raises(AttributeError):
+            user.roles.append("superuser")
+
+        decoder_module._current_user.set(None)
+        assert KeycloakJwtDecoder.decode_token(token).roles == ("admin", "user", "reader")
+
+    def test_decode_token_caches_by_token_digest(self):
+        """Test that the cache is keyed on a short digest instead of the full token."""
+        KeycloakJwtDecoder.decode_token("Bearer " + make_token(CLAIMS))
+
+        assert list(decoder_module._token_cache.keys()) == [
+            KeycloakJwtDecoder._cache_key(make_token(CLAIMS))
+        ]
+        assert len(KeycloakJwtDecoder._cache_key(make_token(CLAIMS))) == 16
+
+    def test_decode_token_reuses_user_for_same_token_in_context(self):
+        """Test that the same token object is resolved from the context without the cache."""
+        token = make_token(CLAIMS)
+        user = KeycloakJwtDecoder.decode_token(token)
+        decoder_module._token_cache.clear()
+
+        assert KeycloakJwtDecoder.decode_token(token) is user
+        assert len(decoder_module._token_cache) == 0
+
+    def test_decode_token_context_is_not_shared(self):
+        """Test that a new context does not see the user decoded in another one."""
+        token = make_token(CLAIMS)
+        user = KeycloakJwtDecoder.decode_token(token)
+        decoder_module._token_cache.clear()
+
+        other = contextvars.Context().run(KeycloakJwtDecoder.decode_token, token)
+
+        assert other is not user
+
+    def test_clear_cache_forces_decode(self):
+        """Test that clearing the cache decodes the token again."""
+        token = make_token(CLAIMS)
+        user = KeycloakJwtDecoder.decode_token(token)
+
+        KeycloakJwtDecoder.clear_cache()
+
+        assert KeycloakJwtDecoder.decode_token(token) is not user
+
+    def test_decode_token_caches_until_exp(self, monkeypatch):
+        """Test that a cached user is not served once the token's exp has passed."""
+        exp = int(time.time()) + 30
+        token = make_token({**CLAIMS, "exp": exp})
+        user = KeycloakJwtDecoder.decode_token(token)
+
+        assert KeycloakJwtDecoder.decode_token(token) is user
+
+        monkeypatch.setattr(decoder_module.time, "time", lambda: exp + 1)
+
+        with pytest.raises(UnauthorizedException):
+            KeycloakJwtDecoder.decode_token(token)
+
+    def test_decode_token_accepts_audience_claim(self):
+        """Test that tokens with an aud claim are decoded."""
+        user = KeycloakJwtDecoder.decode_token(make_token({**CLAIMS, "aud": "account"}))
+
+        assert user.username == "jdoe"
+
+    @pytest.mark.parametrize(
+        "token",
+        [
+            "",
+            "   ",
+            "not-a-jwt",
+            "a.b",
+            "a.b.c.d",
+            ".b.c",
+            "a..c",
+            "a.b.",
+            "..",
+            "a.b.c",
+            "a.WzFd.c",
+            "a.bm90LWpzb24.c",
+            "a.\udc80.c",
+        ],
+    )
+    def test_decode_token_rejects_invalid_format(self, token):
+        """Test that empty or malformed tokens are rejected."""
+        with pytest.raises(UnauthorizedException):
+            KeycloakJwtDecoder.decode_token(token)
+
+    def test_decode_token_rejects_token_not_yet_valid(self):
+        """Test that a token whose nbf is in the future is rejected."""
+        token = make_token({**CLAIMS, "nbf": int(time.time()) + 60})
+
+        with pytest.raises(UnauthorizedException):
+            KeycloakJwtDecoder.decode_token(token)
+
+    def test_decode_token_rejects_expired_token(self):
+        """Test that an expired token is rejected."""
+        token = make_token({**CLAIMS, "exp": int(time.time()) - 60})
+
+        with pytest.raises(UnauthorizedException):
+            KeycloakJwtDecoder.decode_token(token)
@@ -0,0 +1,45 @@
+"""Tests for Keycloak user model."""
+
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from sucrim.keycloak.keycloak_user import KeycloakUser
+
+
+class TestKeycloakUser:
+    """Test cases for KeycloakUser."""
+
+    def test_keycloak_user_defaults(self):
+        """Test that every field is optional and roles default to an empty tuple."""
+        user = KeycloakUser()
+
+        assert user.username is None
+        assert user.email_verified is None
+        assert user.roles == ()
+
+    def test_keycloak_user_is_frozen(self):
+        """Test that a KeycloakUser cannot be modified after creation."""
+        user = KeycloakUser(username="jdoe")
+
+        with pytest.raises(FrozenInstanceError):
+            user.username = "other"
+
+    def test_keycloak_user_is_hashable(self):
+        """Test that users with equal fields hash equally."""
+        first = KeycloakUser(username="jdoe", roles=("admin",))
+        second = KeycloakUser(username="jdoe", roles=("admin",))
+
+        assert hash(first) == hash(second)
+        assert len({first, second}) == 1
+
+    def test_keycloak_user_model_dump(self):
+        """Test that model_dump returns every field as a dictionary."""
+        user = KeycloakUser(username="jdoe", roles=("admin",))
+
+        result = user.model_dump()
+
+        assert result["username"] == "jdoe"
+        assert result["roles"] == ("admin",)
+        assert result["email"] is None
+        assert len(result) == 10